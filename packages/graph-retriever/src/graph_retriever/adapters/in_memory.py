@@ -1,12 +1,15 @@
 import abc
-from collections.abc import Callable, Iterable, Sequence
+from collections.abc import Callable, Hashable, Iterable, Mapping, Sequence
 from typing import Any, TypeAlias
 
+import numpy as np
 from typing_extensions import override
 
 from graph_retriever.adapters.base import Adapter
 from graph_retriever.content import Content
+from graph_retriever.edges import Edge, IdEdge, MetadataEdge
 from graph_retriever.utils.math import cosine_similarity
+from graph_retriever.utils.top_k import top_k
 
 SENTINEL = object()
 
@@ -32,6 +35,15 @@ class InMemoryBase(Adapter, abc.ABC):
         self.store: dict[str, Content] = {c.id: c for c in content}
         self.embedding = embedding
 
+        # Keep the contents in a fixed order alongside a single matrix of their
+        # embeddings (row `i` is the embedding of `self._contents[i]`), so
+        # searches don't need to rebuild the matrix on every call.
+        self._contents: list[Content] = list(self.store.values())
+        self._embeddings: np.ndarray = np.array([c.embedding for c in self._contents])
+        self._rows_by_id: dict[str, int] = {
+            c.id: row for row, c in enumerate(self._contents)
+        }
+
     @override
     def search_with_embedding(
         self,
@@ -74,20 +86,30 @@ class InMemoryBase(Adapter, abc.ABC):
         filter: dict[str, Any] | None = None,
         **kwargs: Any,
     ) -> list[Content]:
-        # get all docs with fixed order in list
-        candidates = self._matching_content(filter)
+        # get the rows of all matching content (in fixed order)
+        if filter:
+            rows = [
+                row for row, c in enumerate(self._contents) if self._matches(filter, c)
+            ]
+            candidates = self._embeddings[rows]
+        else:
+            rows = list(range(len(self._contents)))
+            candidates = self._embeddings
 
-        if not candidates:
+        if not rows or k <= 0:
             return []
 
-        similarity = cosine_similarity([embedding], [c.embedding for c in candidates])[
-            0
-        ]
+        similarity = cosine_similarity([embedding], candidates)[0]
 
-        # get the indices ordered by similarity score
-        top_k_idx = similarity.argsort()[::-1][:k]
+        # get the indices of the top-k ordered by similarity score, only
+        # sorting the top-k rather than all of the candidates
+        if k < len(similarity):
+            top_k_idx = np.argpartition(similarity, -k)[-k:]
+        else:
+            top_k_idx = np.arange(len(similarity))
+        top_k_idx = top_k_idx[similarity[top_k_idx].argsort()[::-1]]
 
-        return [candidates[idx] for idx in top_k_idx]
+        return [self._contents[rows[idx]] for idx in top_k_idx]
 
     @override
     def get(
@@ -100,12 +122,66 @@ class InMemoryBase(Adapter, abc.ABC):
             if self._matches(filter, c)
         ]
 
-    def _matching_content(self, filter: dict[str, Any] | None = None) -> list[Content]:
-        """Return a list of content matching the given filters."""
-        if filter:
-            return [c for c in self.store.values() if self._matches(filter, c)]
-        else:
-            return list(self.store.values())
+    @override
+    def adjacent(
+        self,
+        edges: set[Edge],
+        query_embedding: list[float],
+        k: int,
+        filter: dict[str, Any] | None,
+        **kwargs: Any,
+    ) -> Iterable[Content]:
+        # Rather than searching once per edge, collect the rows of content with
+        # an incoming edge matching any of the edges. The top-k of these is the
+        # same as the top-k of the per-edge top-k results.
+        rows: set[int] = set()
+        edge_filters: list[dict[str, Any]] = []
+        for edge in edges:
+            if isinstance(edge, MetadataEdge):
+                if filter and edge.incoming_field in filter:
+                    # The edge is merged into the filter (as `_metadata_filter`
+                    # does), so the filter's value for the field replaces it
+                    # and any content matching the filter is adjacent.
+                    rows.update(range(len(self._contents)))
+                    continue
+                edge_rows = self._metadata_edge_rows(edge)
+                if edge_rows is None:
+                    edge_filters.append(self._metadata_filter(edge=edge))
+                else:
+                    rows.update(edge_rows)
+            elif isinstance(edge, IdEdge):
+                if (row := self._rows_by_id.get(edge.id)) is not None:
+                    rows.add(row)
+            else:
+                raise ValueError(f"Unsupported edge: {edge}")
+
+        if edge_filters:
+            # Scan for content matching the edges that couldn't be looked up.
+            rows.update(
+                row
+                for row, c in enumerate(self._contents)
+                if any(self._matches(f, c) for f in edge_filters)
+            )
+
+        results = [
+            c for row in sorted(rows) if self._matches(filter, c := self._contents[row])
+        ]
+        return top_k(results, embedding=query_embedding, k=k)
+
+    @override
+    async def aadjacent(
+        self,
+        edges: set[Edge],
+        query_embedding: list[float],
+        k: int,
+        filter: dict[str, Any] | None,
+        **kwargs: Any,
+    ) -> Iterable[Content]:
+        return self.adjacent(edges, query_embedding, k, filter, **kwargs)
+
+    def _metadata_edge_rows(self, edge: MetadataEdge) -> Iterable[int] | None:
+        """Return the rows matching the edge, or `None` to scan with a filter."""
+        return None
 
     def _matches(self, filter: dict[str, Any] | None, content: Content) -> bool:
         """Return whether `content` matches the given `filter`."""
@@ -135,6 +211,60 @@ class InMemory(InMemoryBase):
     This In-Memory store simulates VectorStores like AstraDB and OpenSearch
     """
 
+    def __init__(self, embedding: Embedding, content: list[Content]) -> None:
+        super().__init__(embedding, content)
+
+        # Reverse index for each metadata field used by an edge, mapping each
+        # value to the rows of content matching it. Built lazily, with `None`
+        # for fields whose values can't be indexed.
+        self._reverse_index: dict[str, dict[Any, list[int]] | None] = {}
+
+    @override
+    def _metadata_edge_rows(self, edge: MetadataEdge) -> Iterable[int] | None:
+        field = edge.incoming_field
+        if field not in self._reverse_index:
+            self._reverse_index[field] = self._index_field(field)
+
+        index = self._reverse_index[field]
+        if index is None:
+            return None
+        try:
+            return index.get(edge.value, [])
+        except TypeError:
+            # Unhashable edge value.
+            return None
+
+    def _index_field(self, field: str) -> dict[Any, list[int]] | None:
+        """Index the rows by the values they match (see `_value_matches`)."""
+        index: dict[Any, list[int]] = {}
+        key_parts = field.split(".")
+        for row, content in enumerate(self._contents):
+            value: Any = content.metadata
+            for key_part in key_parts:
+                value = value.get(key_part, SENTINEL)
+                if value is SENTINEL:
+                    break
+            if value is SENTINEL:
+                continue
+
+            if isinstance(value, Mapping):
+                # Matching a mapping depends on more than membership.
+                return None
+            elif isinstance(value, Iterable) and not isinstance(value, str | bytes):
+                values = list(value)
+                if isinstance(value, Hashable):
+                    values.append(value)
+            else:
+                values = [value]
+
+            try:
+                for v in dict.fromkeys(values):
+                    index.setdefault(v, []).append(row)
+            except TypeError:
+                # Unhashable values.
+                return None
+        return index
+
     @override
     def _value_matches(self, filter_value: str, content_value: Any) -> bool:
         return (filter_value == content_value) or (
@@ -1,7 +1,8 @@
 """Utilities for handling and extracting edges in metadata."""
 
+import functools
 import warnings
-from collections.abc import Iterable
+from collections.abc import Callable, Iterable
 from typing import Any, TypeAlias
 
 from graph_retriever.content import Content
@@ -47,15 +48,35 @@ id_to_mentions_edge       = ("$id", "mentions)
 """
 
 
-def _nested_get(metadata: dict[str, Any], key: str) -> Any:
+def _nested_get(metadata: dict[str, Any], path: tuple[str, ...]) -> Any:
     value = metadata
-    for key_part in key.split("."):
+    for key_part in path:
         value = value.get(key_part, SENTINEL)
         if value is SENTINEL:
             break
     return value
 
 
+def _field_path(field: str | Id) -> tuple[str, ...] | None:
+    """Return the metadata path of a field, or `None` if it is the ID."""
+    if field == ID_MAGIC_STRING or isinstance(field, Id):
+        return None
+    assert isinstance(field, str)
+    return tuple(field.split("."))
+
+
+def _id_edge(value: Any) -> Edge:
+    return IdEdge(id=str(value))
+
+
+@functools.lru_cache(maxsize=65536, typed=True)
+def _metadata_edge(incoming_field: str, value: Any) -> Edge:
+    # Values are often repeated across content (e.g., shared keywords), so the
+    # edges are interned. Equal edges are then the same object, which lets set
+    # operations during traversal short-circuit on identity.
+    return MetadataEdge(incoming_field=incoming_field, value=value)
+
+
 class MetadataEdgeFunction:
     """
     Helper for extracting and encoding edges in metadata.
@@ -87,64 +108,75 @@ class MetadataEdgeFunction:
             if not isinstance(target, str | Id):
                 raise ValueError(f"Expected 'str | Id' but got: {target}")
 
-    def _edges_from_dict(
+        # Parse the edge definitions once, rather than on every call. Each entry
+        # holds the source and target paths (`None` for the ID) and a function
+        # creating an edge to the target from a value.
+        self._parsed_edges: list[
+            tuple[
+                tuple[str, ...] | None,
+                tuple[str, ...] | None,
+                Callable[[Any], Edge],
+            ]
+        ] = []
+        for source, target in edges:
+            target_path = _field_path(target)
+            if target_path is None:
+                mk_edge = _id_edge
+            else:
+                assert isinstance(target, str)
+                mk_edge = functools.partial(_metadata_edge, target)
+            self._parsed_edges.append((_field_path(source), target_path, mk_edge))
+
+    def _edges_from_path(
         self,
         id: str,
         metadata: dict[str, Any],
-        *,
-        incoming: bool = False,
-    ) -> set[Edge]:
+        path: tuple[str, ...] | None,
+        mk_edge: Callable[[Any], Edge],
+    ) -> list[Edge]:
         """
-        Extract edges from the metadata based on declared edge definitions.
+        Extract edges from the value at a path in the metadata.
 
         Parameters
         ----------
-        metadata :dict[str, Any]
+        id :
+            The ID of the content, used if `path` is `None`.
+        metadata :
             The metadata dictionary to process.
-        incoming :
-            If True, extracts edges for incoming relationships.
+        path :
+            The path of the metadata field, or `None` to use the ID.
+        mk_edge :
+            Function creating an edge from each value.
 
         Returns
         -------
         :
-            A set of edges extracted from the metadata.
+            The edges extracted from the metadata.
 
         Notes
         -----
         - Handles both simple (key-value) and iterable metadata fields.
         - Issues warnings for unsupported or unexpected values.
         """
-        edges: set[Edge] = set()
-        for source_key, target_key in self.edges:
-            if incoming:
-                source_key = target_key
-
-            if target_key == ID_MAGIC_STRING or isinstance(target_key, Id):
-
-                def mk_edge(v) -> Edge:
-                    return IdEdge(id=str(v))
-            else:
-
-                def mk_edge(v) -> Edge:
-                    return MetadataEdge(incoming_field=target_key, value=v)
-
-            if source_key == ID_MAGIC_STRING or isinstance(source_key, Id):
-                edges.add(mk_edge(id))
-            else:
-                value = _nested_get(metadata, source_key)
-                if isinstance(value, BASIC_TYPES):
-                    edges.add(mk_edge(value))
-                elif isinstance(value, Iterable):
-                    for item in value:
-                        if isinstance(item, BASIC_TYPES):
-                            edges.add(mk_edge(item))
-                        else:
-                            warnings.warn(
-                                f"Unsupported item value {item} in '{source_key}'"
-                            )
-                elif value is not SENTINEL:
-                    warnings.warn(f"Unsupported value {value} in '{source_key}'")
-        return edges
+        if path is None:
+            return [mk_edge(id)]
+
+        value = _nested_get(metadata, path)
+        if isinstance(value, BASIC_TYPES):
+            return [mk_edge(value)]
+        elif isinstance(value, Iterable):
+            edges = []
+            for item in value:
+                if isinstance(item, BASIC_TYPES):
+                    edges.append(mk_edge(item))
+                else:
+                    warnings.warn(
+                        f"Unsupported item value {item} in '{'.'.join(path)}'"
+                    )
+            return edges
+        elif value is not SENTINEL:
+            warnings.warn(f"Unsupported value {value} in '{'.'.join(path)}'")
+        return []
 
     def __call__(self, content: Content) -> Edges:
         """
@@ -163,9 +195,24 @@ class MetadataEdgeFunction:
         :
             the incoming and outgoing edges of the node
         """
-        outgoing_edges = self._edges_from_dict(content.id, content.metadata)
-        incoming_edges = self._edges_from_dict(
-            content.id, content.metadata, incoming=True
-        )
+        # Compute the incoming and outgoing edges in a single pass over the
+        # edge definitions.
+        incoming_edges: set[Edge] = set()
+        outgoing_edges: set[Edge] = set()
+        for source_path, target_path, mk_edge in self._parsed_edges:
+            outgoing = self._edges_from_path(
+                content.id, content.metadata, source_path, mk_edge
+            )
+            outgoing_edges.update(outgoing)
+            if target_path == source_path:
+                # Bi-directional edges (such as `("keywords", "keywords")`) have
+                # the same incoming and outgoing edges.
+                incoming_edges.update(outgoing)
+            else:
+                incoming_edges.update(
+                    self._edges_from_path(
+                        content.id, content.metadata, target_path, mk_edge
+                    )
+                )
 
         return Edges(incoming=incoming_edges, outgoing=outgoing_edges)
@@ -220,6 +220,12 @@ class Strategy(abc.ABC):
         ------
         ValueError
             If 'strategy' is set incorrectly or extra arguments are invalid.
+
+        Notes
+        -----
+        - If there are no options to apply, the strategy is returned without
+          being copied. Traversals copy the strategy before using it, so this
+          avoids allocating a new strategy on every retrieval.
         """
         # Check if there is a new strategy to use. Otherwise, use the base.
         strategy: Strategy
@@ -239,6 +245,8 @@ class Strategy(abc.ABC):
 
         # Apply the kwargs to update the strategy.
         assert strategy is not None
+        if not kwargs:
+            return strategy
         if "k" in kwargs:
             kwargs["select_k"] = kwargs.pop("k")
         strategy = dataclasses.replace(strategy, **kwargs)
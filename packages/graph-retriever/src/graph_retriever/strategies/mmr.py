@@ -260,18 +260,14 @@ class Mmr(Strategy):
         nodes = list(nodes)
         node_count = len(nodes)
         if node_count > 0:
-            # Build up a matrix of the remaining candidate embeddings.
-            # And add them to the candidate set
-            new_embeddings: NDArray[np.float32] = np.ndarray(
-                (
-                    node_count,
-                    self._dimensions,
-                )
-            )
+            # Build up a matrix of the remaining candidate embeddings in a single
+            # conversion (rather than row by row), and add them to the candidates.
+            new_embeddings: NDArray[np.float32] = np.array(
+                [candidate_node.embedding for candidate_node in nodes]
+            ).reshape(node_count, self._dimensions)
             offset = self._candidate_embeddings.shape[0]
             for index, candidate_node in enumerate(nodes):
                 self._candidate_id_to_index[candidate_node.id] = offset + index
-                new_embeddings[index] = candidate_node.embedding
 
             # Compute the similarity to the query.
             similarity = cosine_similarity(new_embeddings, self._nd_query_embedding)
@@ -8,15 +8,6 @@ from graph_retriever.strategies.base import NodeTracker, Strategy
 from graph_retriever.types import Node
 
 
-class _ScoredNode:
-    def __init__(self, score: float, node: Node) -> None:
-        self.score = score
-        self.node = node
-
-    def __lt__(self, other: "_ScoredNode") -> bool:
-        return other.score < self.score
-
-
 @dataclasses.dataclass
 class Scored(Strategy):
     """
@@ -29,7 +20,13 @@ class Scored(Strategy):
     Parameters
     ----------
     scorer:
-        A callable function that returns the score of a node.
+        A callable function that returns the score of a node. It is called
+        once per discovered node, so it doesn't need to cache its results.
+    batch_scorer:
+        A callable function that returns the scores of a list of nodes, in the
+        same order. It is called once per iteration with the newly discovered
+        nodes, allowing scores to be computed in a vectorized manner (e.g., with
+        NumPy). Exactly one of `scorer` and `batch_scorer` must be set.
     select_k :
         Maximum number of nodes to retrieve during traversal.
     start_k :
@@ -47,24 +44,56 @@ class Scored(Strategy):
         Maximum number of nodes to select and return during traversal.
     """
 
-    scorer: Callable[[Node], float]
-    _nodes: list[_ScoredNode] = dataclasses.field(default_factory=list)
+    scorer: Callable[[Node], float] | None = None
+    batch_scorer: Callable[[list[Node]], Iterable[float]] | None = None
+
+    # Heap of `(-score, sequence, node)` entries. Negating the score makes
+    # `heapq` pop the highest score first, and the sequence number breaks ties
+    # (in discovery order) so nodes themselves are never compared.
+    _nodes: list[tuple[float, int, Node]] = dataclasses.field(default_factory=list)
+    _sequence: int = dataclasses.field(default=0, init=False, repr=False, compare=False)
 
     per_iteration_limit: int | None = None
 
+    def __post_init__(self):
+        """Check that exactly one of `scorer` and `batch_scorer` is set."""
+        super().__post_init__()
+        if (self.scorer is None) == (self.batch_scorer is None):
+            raise ValueError("Exactly one of 'scorer' or 'batch_scorer' must be set")
+
     @override
     def iteration(self, nodes: Iterable[Node], tracker: NodeTracker) -> None:
-        for node in nodes:
-            heapq.heappush(self._nodes, _ScoredNode(self.scorer(node), node))
+        nodes = list(nodes)
+        scores: Iterable[float]
+        if self.batch_scorer is not None:
+            scores = self.batch_scorer(nodes)
+        else:
+            assert self.scorer is not None
+            scores = map(self.scorer, nodes)
+
+        entries = [
+            (-float(score), sequence, node)
+            for sequence, (node, score) in enumerate(
+                zip(nodes, scores, strict=True), start=self._sequence
+            )
+        ]
+        self._sequence += len(entries)
+        if self._nodes:
+            for entry in entries:
+                heapq.heappush(self._nodes, entry)
+        else:
+            # Building the heap in one go is linear, rather than pushing each
+            # node (such as the initial nodes of the traversal).
+            heapq.heapify(entries)
+            self._nodes = entries
 
         limit = tracker.num_remaining
         if self.per_iteration_limit:
             limit = min(limit, self.per_iteration_limit)
 
         while limit > 0 and self._nodes:
-            highest = heapq.heappop(self._nodes)
-            node = highest.node
-            node.extra_metadata["_score"] = highest.score
+            negated_score, _, node = heapq.heappop(self._nodes)
+            node.extra_metadata["_score"] = -negated_score
             limit -= tracker.select_and_traverse([node])
 
     @override
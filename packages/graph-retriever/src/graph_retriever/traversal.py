@@ -6,7 +6,13 @@ from typing import Any
 
 from graph_retriever.adapters import Adapter
 from graph_retriever.content import Content
-from graph_retriever.edges import Edge, EdgeFunction, EdgeSpec, MetadataEdgeFunction
+from graph_retriever.edges import (
+    Edge,
+    EdgeFunction,
+    EdgeSpec,
+    IdEdge,
+    MetadataEdgeFunction,
+)
 from graph_retriever.strategies import NodeTracker, Strategy
 from graph_retriever.types import Node
 from graph_retriever.utils.math import cosine_similarity
@@ -358,9 +364,11 @@ class _Traversal:
             # Determine incoming/outgoing edges.
             edges = self.edge_function(content)
 
-            # Compute the depth
-            if depth is None:
-                depth = min(
+            # Compute the depth. The frontier may contain nodes from different
+            # depths, so this is computed for each node.
+            node_depth = depth
+            if node_depth is None:
+                node_depth = min(
                     [
                         d
                         for e in edges.incoming
@@ -373,7 +381,7 @@ class _Traversal:
                 Node(
                     id=content.id,
                     content=content.content,
-                    depth=depth,
+                    depth=node_depth,
                     embedding=content.embedding,
                     similarity_score=score,
                     metadata=content.metadata,
@@ -410,6 +418,7 @@ class _Traversal:
         updated to reflect the shortest path.
         - The `_visited_edges` set is updated to include all outgoing edges
         from the provided nodes.
+        - Edges to the IDs of already discovered nodes are not returned.
         """
         new_outgoing_edges: dict[Edge, int] = {}
         for node in nodes.values():
@@ -423,4 +432,11 @@ class _Traversal:
 
         new_outgoing_edge_set = set(new_outgoing_edges.keys())
         self._visited_edges.update(new_outgoing_edge_set)
-        return new_outgoing_edge_set
+
+        # Edges to specific IDs that have already been discovered can only lead
+        # to content that would be discarded, so don't fetch them.
+        return {
+            edge
+            for edge in new_outgoing_edge_set
+            if not isinstance(edge, IdEdge) or edge.id not in self._discovered_node_ids
+        }
@@ -8,7 +8,7 @@ from typing import Any
 from graph_retriever.edges import Edge
 
 
-@dataclass
+@dataclass(slots=True)
 class Node:
     """
     Represents a node in the traversal graph.
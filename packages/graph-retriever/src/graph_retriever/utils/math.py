@@ -6,6 +6,15 @@ import numpy as np
 
 logger = logging.getLogger(__name__)
 
+try:
+    import simsimd as simd
+except ImportError:  # pragma: no cover
+    simd = None  # type: ignore[assignment]
+    logger.debug(
+        "Unable to import simsimd, defaulting to NumPy implementation. If you want "
+        "to use simsimd please install with `pip install simsimd`."
+    )
+
 Matrix = list[list[float]] | list[np.ndarray] | np.ndarray
 
 
@@ -50,18 +59,12 @@ def cosine_similarity(X: Matrix, Y: Matrix) -> np.ndarray:
             f"Number of columns in X and Y must be the same. X has shape {X.shape} "
             f"and Y has shape {Y.shape}."
         )
-    try:
-        import simsimd as simd
-
+    if simd is not None:
         X = np.array(X, dtype=np.float32)
         Y = np.array(Y, dtype=np.float32)
         Z = 1 - np.array(simd.cdist(X, Y, metric="cosine"))
         return Z
-    except ImportError:
-        logger.debug(
-            "Unable to import simsimd, defaulting to NumPy implementation. If you want "
-            "to use simsimd please install with `pip install simsimd`."
-        )
+    else:
         X_norm = np.linalg.norm(X, axis=1)
         Y_norm = np.linalg.norm(Y, axis=1)
         # Ignore divide by zero errors run time warnings as those are handled below.
@@ -38,14 +38,9 @@ def top_k(
         list(unscored.values()), embedding=embedding, k=k
     )
 
-    sorted = list(top_scored.values())
-    sorted.sort(key=_score, reverse=True)
-
-    return [c[0] for c in sorted]
-
-
-def _score(content_with_score: tuple[Content, float]) -> float:
-    return content_with_score[1]
+    # `cosine_similarity_top_k` returns the results in descending order of
+    # similarity, so there is no need to sort them again.
+    return [c[0] for c in top_scored.values()]
 
 
 def _similarity_sort_top_k(
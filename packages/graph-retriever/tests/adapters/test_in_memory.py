@@ -1,7 +1,10 @@
 import pytest
+from graph_retriever import Content
 from graph_retriever.adapters import Adapter
 from graph_retriever.adapters.in_memory import InMemory
+from graph_retriever.edges import IdEdge, MetadataEdge
 from graph_retriever.testing.adapter_tests import AdapterComplianceSuite
+from graph_retriever.testing.embeddings import angular_2d_embedding
 
 
 class TestInMemory(AdapterComplianceSuite):
@@ -9,3 +12,67 @@ class TestInMemory(AdapterComplianceSuite):
     def adapter(self, animals: Adapter) -> Adapter:
         assert isinstance(animals, InMemory)
         return animals
+
+
+def test_adjacent_reverse_index():
+    embedding = angular_2d_embedding
+    store = InMemory(
+        embedding,
+        [
+            Content.new("scalar", "+0.100", embedding, metadata={"k": "a"}),
+            Content.new("list", "+0.200", embedding, metadata={"k": ["a", "b"]}),
+            Content.new("tuple", "+0.300", embedding, metadata={"k": ("a", "b")}),
+            Content.new("dict", "+0.400", embedding, metadata={"d": {"a": 1}}),
+            Content.new("none", "+0.500", embedding),
+        ],
+    )
+
+    def adjacent_ids(*edges: MetadataEdge) -> list[str]:
+        results = store.adjacent(
+            set(edges),
+            query_embedding=embedding("+0.000"),
+            k=10,
+            filter=None,
+        )
+        return [c.id for c in results]
+
+    assert adjacent_ids(MetadataEdge("k", "a")) == ["scalar", "list", "tuple"]
+    assert adjacent_ids(MetadataEdge("k", ("a", "b"))) == ["tuple"]
+    assert adjacent_ids(MetadataEdge("k", "c")) == []
+
+    # Mapping values aren't indexed, but can still be matched.
+    assert adjacent_ids(MetadataEdge("d", {"a": 1})) == ["dict"]
+    assert store._reverse_index["d"] is None
+
+
+@pytest.mark.parametrize(
+    "edges, filter",
+    [
+        ({MetadataEdge("h", "desert")}, None),
+        ({MetadataEdge("h", "desert")}, {"h": "savanna"}),
+        ({MetadataEdge("h", "desert")}, {"t": "x"}),
+        ({MetadataEdge("h", "desert"), MetadataEdge("t", "y")}, {"h": "savanna"}),
+        ({MetadataEdge("h", "desert"), IdEdge("b")}, {"t": "x"}),
+        ({MetadataEdge("d", {"a": 1})}, {"d": {"a": 2}}),
+    ],
+)
+async def test_adjacent_matches_base(edges, filter):
+    embedding = angular_2d_embedding
+    store = InMemory(
+        embedding,
+        [
+            Content.new("a", "+0.100", embedding, metadata={"h": "desert", "t": "x"}),
+            Content.new("b", "+0.200", embedding, metadata={"h": "savanna", "t": "x"}),
+            Content.new(
+                "c", "+0.300", embedding, metadata={"h": ["savanna", "desert"]}
+            ),
+            Content.new("d", "+0.400", embedding, metadata={"t": "y"}),
+            Content.new("e", "+0.500", embedding, metadata={"d": {"a": 2}}),
+        ],
+    )
+    kwargs = dict(edges=edges, query_embedding=embedding("+0.000"), k=10, filter=filter)
+
+    expected = [c.id for c in Adapter.adjacent(store, **kwargs)]
+    assert [c.id for c in store.adjacent(**kwargs)] == expected
+    assert [c.id for c in await store.aadjacent(**kwargs)] == expected
+    assert [c.id for c in await Adapter.aadjacent(store, **kwargs)] == expected
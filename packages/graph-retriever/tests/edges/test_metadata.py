@@ -1,3 +1,4 @@
+import random
 from typing import Any
 
 import pytest
@@ -16,27 +17,80 @@ def mk_node(metadata: dict[str, Any]) -> Node:
     )
 
 
+@pytest.fixture(scope="module")
+def href_to_url() -> MetadataEdgeFunction:
+    # Edge functions don't change after construction, so share one.
+    return MetadataEdgeFunction([("href", "url")])
+
+
 def test_initialization():
     edge_function = MetadataEdgeFunction([("a", "a"), ("b", "c"), ("b", "b")])
     assert edge_function.edges == [("a", "a"), ("b", "c"), ("b", "b")]
 
 
-def test_edge_function():
-    edge_function = MetadataEdgeFunction([("href", "url")])
-    assert edge_function(mk_node({"href": "a", "url": "b"})) == Edges(
-        {MetadataEdge("url", "b")},
-        {MetadataEdge("url", "a")},
-    )
-
-    assert edge_function(mk_node({"href": ["a", "c"], "url": "b"})) == Edges(
-        {MetadataEdge("url", "b")},
-        {MetadataEdge("url", "a"), MetadataEdge("url", "c")},
-    )
-
-    assert edge_function(mk_node({"href": ["a", "c"], "url": ["b", "d"]})) == Edges(
-        {MetadataEdge("url", "b"), MetadataEdge("url", "d")},
-        {MetadataEdge("url", "a"), MetadataEdge("url", "c")},
-    )
+@pytest.mark.parametrize(
+    "metadata,expected",
+    [
+        (
+            {"href": "a", "url": "b"},
+            Edges(
+                {MetadataEdge("url", "b")},
+                {MetadataEdge("url", "a")},
+            ),
+        ),
+        (
+            {"href": ["a", "c"], "url": "b"},
+            Edges(
+                {MetadataEdge("url", "b")},
+                {MetadataEdge("url", "a"), MetadataEdge("url", "c")},
+            ),
+        ),
+        (
+            {"href": ["a", "c"], "url": ["b", "d"]},
+            Edges(
+                {MetadataEdge("url", "b"), MetadataEdge("url", "d")},
+                {MetadataEdge("url", "a"), MetadataEdge("url", "c")},
+            ),
+        ),
+    ],
+)
+def test_edge_function(href_to_url, metadata, expected):
+    assert href_to_url(mk_node(metadata)) == expected
+
+
+def test_edge_function_random_metadata(href_to_url):
+    rng = random.Random(42)
+    values = ["a", "b", "c", "d", "e"]
+
+    def random_value() -> str | list[str]:
+        if rng.random() < 0.5:
+            return rng.choice(values)
+        return rng.sample(values, rng.randint(0, len(values)))
+
+    def as_set(value: str | list[str]) -> set[str]:
+        return {value} if isinstance(value, str) else set(value)
+
+    for _ in range(200):
+        metadata = {
+            key: random_value() for key in ("href", "url") if rng.random() < 0.8
+        }
+        edges = href_to_url(mk_node(metadata))
+
+        assert edges.incoming == {
+            MetadataEdge("url", v) for v in as_set(metadata.get("url", []))
+        }
+        assert edges.outgoing == {
+            MetadataEdge("url", v) for v in as_set(metadata.get("href", []))
+        }
+
+
+def test_edges_shared():
+    edge_function = MetadataEdgeFunction([("keywords", "keywords")])
+    first = edge_function(mk_node({"keywords": ["a"]}))
+    second = edge_function(mk_node({"keywords": ["a", "b"]}))
+
+    (edge,) = first.outgoing
+    assert any(e is edge for e in second.outgoing)
 
 
 def test_nested_edge():
@@ -66,8 +120,8 @@ def test_link_from_id():
     assert result.outgoing == {MetadataEdge("mentions", "id")}
 
 
-def test_unsupported_values():
-    edge_function = MetadataEdgeFunction([("href", "url")])
+def test_unsupported_values(href_to_url):
+    edge_function = href_to_url
 
     # Unsupported value
     with pytest.warns(UserWarning, match=r"Unsupported value .* in 'href'"):
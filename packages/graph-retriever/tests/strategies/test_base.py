@@ -14,6 +14,7 @@ def test_build_strategy_base():
     # base strategy with no changes
     strategy = Strategy.build(base_strategy=base_strategy)
     assert strategy == base_strategy
+    assert strategy is base_strategy
 
     # base strategy with changed k
     strategy = Strategy.build(base_strategy=base_strategy, select_k=7)
@@ -2,7 +2,7 @@ import pytest
 from graph_retriever import Content
 from graph_retriever.adapters import Adapter
 from graph_retriever.adapters.in_memory import InMemory
-from graph_retriever.edges import Edges, MetadataEdge
+from graph_retriever.edges import Edges, IdEdge, MetadataEdge
 from graph_retriever.strategies import (
     Eager,
 )
@@ -341,6 +341,32 @@ async def test_ids(sync_or_async: SyncOrAsync):
     assert await id_to_mentions(max_depth=2) == ["v0", "v1", "v2"]
 
 
+async def test_ids_skips_discovered(sync_or_async: SyncOrAsync):
+    embedding = angular_2d_embedding
+    v0 = Content.new("v0", "+0.000", embedding, metadata={"mentions": ["v1"]})
+    v1 = Content.new("v1", "+0.010", embedding, metadata={"mentions": ["v0", "v2"]})
+    v2 = Content.new("v2", "+1.000", embedding)
+
+    class RecordingInMemory(InMemory):
+        requested_ids: list[str] = []
+
+        def adjacent(self, edges, query_embedding, k, filter, **kwargs):
+            self.requested_ids.extend(e.id for e in edges if isinstance(e, IdEdge))
+            return super().adjacent(edges, query_embedding, k, filter, **kwargs)
+
+    store = RecordingInMemory(embedding, [v0, v1, v2])
+    traversal = sync_or_async.traverse_sorted_ids(
+        store=store,
+        query="+0.005",
+        strategy=Eager(start_k=2),
+        edges=[("mentions", "$id")],
+    )
+    assert await traversal(max_depth=1) == ["v0", "v1", "v2"]
+
+    # `v0` and `v1` were found by the initial search, so only `v2` is fetched.
+    assert store.requested_ids == ["v2"]
+
+
 async def test_edge_functions(sync_or_async: SyncOrAsync):
     embedding = angular_2d_embedding
     v0 = Content.new(
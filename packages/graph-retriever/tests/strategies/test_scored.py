@@ -1,7 +1,11 @@
+import numpy as np
 import pytest
+from graph_retriever import Content
 from graph_retriever.adapters.base import Adapter
+from graph_retriever.adapters.in_memory import InMemory
 from graph_retriever.strategies.scored import Scored
 from graph_retriever.testing.adapter_tests import cosine_similarity_scores
+from graph_retriever.testing.embeddings import angular_2d_embedding
 from graph_retriever.types import Node
 
 from tests.testing.adapters import ANIMALS_QUERY
@@ -46,6 +50,74 @@ async def test_animals_keywords(animals: Adapter, sync_or_async: SyncOrAsync):
     ]
 
 
+def test_requires_one_scorer():
+    with pytest.raises(ValueError, match="Exactly one of"):
+        Scored()
+    with pytest.raises(ValueError, match="Exactly one of"):
+        Scored(
+            scorer=score_animals,
+            batch_scorer=lambda nodes: [score_animals(n) for n in nodes],
+        )
+
+
+def test_sequence_is_internal():
+    strategy = Scored(scorer=score_animals)
+    strategy._sequence = 3
+    assert strategy == Scored(scorer=score_animals)
+    assert "_sequence" not in repr(strategy)
+    with pytest.raises(TypeError, match="_sequence"):
+        Scored(scorer=score_animals, _sequence=1)
+
+
+async def test_batch_scorer(animals: Adapter, sync_or_async: SyncOrAsync):
+    batches: list[int] = []
+
+    def batch_score_animals(nodes: list[Node]) -> np.ndarray:
+        batches.append(len(nodes))
+        return np.array([score_animals(n) for n in nodes])
+
+    traversal = sync_or_async.traverse(
+        store=animals,
+        query=ANIMALS_QUERY,
+        edges=[("habitat", "habitat")],
+        strategy=Scored(batch_scorer=batch_score_animals, start_k=2),
+    )
+    results = await traversal(select_k=8, max_depth=2)
+    expected = await sync_or_async.traverse(
+        store=animals,
+        query=ANIMALS_QUERY,
+        edges=[("habitat", "habitat")],
+        strategy=Scored(scorer=score_animals, start_k=2),
+    )(select_k=8, max_depth=2)
+
+    assert [n.id for n in results] == [n.id for n in expected]
+    assert [n.extra_metadata["_score"] for n in results] == [
+        n.extra_metadata["_score"] for n in expected
+    ]
+    # One call per iteration, rather than one per node.
+    assert len(batches) < sum(batches)
+
+
+async def test_scorer_called_once_per_node(
+    animals: Adapter, sync_or_async: SyncOrAsync
+):
+    scored_ids: list[str] = []
+
+    def recording_scorer(node: Node) -> float:
+        scored_ids.append(node.id)
+        return score_animals(node)
+
+    await sync_or_async.traverse(
+        store=animals,
+        query=ANIMALS_QUERY,
+        edges=[("habitat", "habitat"), ("keywords", "keywords")],
+        strategy=Scored(scorer=recording_scorer, start_k=2),
+    )(select_k=8, max_depth=2)
+
+    assert len(scored_ids) > 8
+    assert len(scored_ids) == len(set(scored_ids))
+
+
 async def test_animals_populates_metrics_and_order(
     animals: Adapter, sync_or_async: SyncOrAsync
 ):
@@ -95,3 +167,42 @@ async def test_animals_populates_metrics_and_order(
     assert [n.id for n in results] == expected_ids_in_order, (
         "incorrect order of results"
     )
+
+
+async def test_depths_of_mixed_depth_frontier(sync_or_async: SyncOrAsync):
+    embedding = angular_2d_embedding
+    store = InMemory(
+        embedding,
+        [
+            Content.new("r1", "+0.010", embedding, metadata={"mentions": ["c1"]}),
+            Content.new("r2", "+0.020", embedding, metadata={"mentions": ["c2"]}),
+            Content.new("r3", "+0.030", embedding, metadata={"mentions": ["g3"]}),
+            Content.new("c1", "+0.500", embedding, metadata={"mentions": ["g1"]}),
+            Content.new("c2", "+0.600", embedding),
+            Content.new("g1", "+0.700", embedding),
+            Content.new("g3", "+0.800", embedding),
+        ],
+    )
+
+    # With two nodes selected per iteration, the second iteration traverses
+    # `c1` (depth 1) along with `r3` (depth 0).
+    scores = {"r1": 10, "r2": 9, "c1": 8, "r3": 7, "c2": 6, "g1": 5, "g3": 4}
+    results = await sync_or_async.traverse(
+        store=store,
+        query="+0.000",
+        edges=[("mentions", "$id")],
+        strategy=Scored(
+            scorer=lambda node: scores[node.id], start_k=3, per_iteration_limit=2
+        ),
+    )(select_k=10)
+
+    depths = {n.id: n.extra_metadata["_depth"] for n in results}
+    assert depths == {
+        "r1": 0,
+        "r2": 0,
+        "r3": 0,
+        "c1": 1,
+        "c2": 1,
+        "g3": 1,
+        "g1": 2,
+    }
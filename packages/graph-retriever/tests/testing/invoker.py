@@ -3,6 +3,7 @@ from __future__ import annotations
 import abc
 import dataclasses
 from collections.abc import Callable, Sequence
+from operator import attrgetter
 from typing import Any, Generic, TypeVar
 
 import pytest
@@ -11,6 +12,8 @@ from graph_retriever.adapters import Adapter
 from graph_retriever.edges import EdgeFunction, EdgeSpec
 from graph_retriever.strategies import Strategy
 
+_node_id = attrgetter("id")
+
 
 class SyncOrAsync(abc.ABC):
     @abc.abstractmethod
@@ -24,7 +27,7 @@ class SyncOrAsync(abc.ABC):
         strategy: Strategy | None = None,
     ) -> TraversalCall[list[str]]:
         return TraversalCall(
-            transform=lambda nodes: sorted([n.id for n in nodes]),
+            transform=lambda nodes: sorted(map(_node_id, nodes)),
             sync_or_async=self,
             store=store,
             query=query,
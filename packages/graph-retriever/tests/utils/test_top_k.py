@@ -0,0 +1,23 @@
+from graph_retriever import Content
+from graph_retriever.testing.embeddings import angular_2d_embedding
+from graph_retriever.utils.top_k import top_k
+
+
+def test_top_k_ordered_by_similarity():
+    """Test that the top-k are returned from most to least similar."""
+    contents = [
+        Content.new(id, id, angular_2d_embedding)
+        for id in ["+0.500", "+0.100", "-0.200", "+0.300", "+0.010"]
+    ]
+
+    result = top_k(contents, embedding=angular_2d_embedding("+0.000"), k=3)
+    assert [c.id for c in result] == ["+0.010", "+0.100", "-0.200"]
+
+
+def test_top_k_deduplicates():
+    """Test that duplicate content doesn't take more than one of the k slots."""
+    a = Content.new("a", "+0.100", angular_2d_embedding)
+    b = Content.new("b", "+0.200", angular_2d_embedding)
+
+    result = top_k([a, a, b], embedding=angular_2d_embedding("+0.000"), k=2)
+    assert [c.id for c in result] == ["a", "b"]
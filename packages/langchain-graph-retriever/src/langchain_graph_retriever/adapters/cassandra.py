@@ -1,5 +1,6 @@
 """Provides an adapter for Cassandra vector store integration."""
 
+import asyncio
 from collections.abc import Sequence
 from typing import Any
 
@@ -41,26 +42,20 @@ class CassandraAdapter(ShreddedLangchainAdapter[Cassandra]):
         filter: dict[str, str] | None = None,
         **kwargs: Any,
     ) -> list[Document]:
-        results = self._similarity_search_with_embedding_id_by_vector(
+        return self._similarity_search_by_vector(
             embedding=embedding,
             k=k,
             filter=filter,
             **kwargs,
         )
-        docs: list[Document] = []
-        for doc, embedding, id in results:
-            doc.metadata[METADATA_EMBEDDING_KEY] = embedding
-            doc.id = id
-            docs.append(doc)
-        return docs
 
-    def _similarity_search_with_embedding_id_by_vector(
+    def _similarity_search_by_vector(
         self,
         embedding: list[float],
         k: int = 4,
         filter: dict[str, str] | None = None,
         body_search: str | list[str] | None = None,
-    ) -> list[tuple[Document, list[float], str]]:
+    ) -> list[Document]:
         kwargs: dict[str, Any] = {}
         if filter is not None:
             kwargs["metadata"] = filter
@@ -75,14 +70,8 @@ class CassandraAdapter(ShreddedLangchainAdapter[Cassandra]):
             n=k,
             **kwargs,
         )
-        return [
-            (
-                self.vector_store._row_to_document(row=hit),
-                hit["vector"],
-                hit["row_id"],
-            )
-            for hit in hits
-        ]
+        # Convert each row directly, including the embedding and ID.
+        return [self._row_to_doc(hit) for hit in hits]
 
     @override
     async def _asearch(  # type: ignore
@@ -120,15 +109,16 @@ class CassandraAdapter(ShreddedLangchainAdapter[Cassandra]):
         self, ids: Sequence[str], filter: dict[str, Any] | None = None, **kwargs: Any
     ) -> list[Document]:
         filter = self.update_filter_hook(filter)
-        docs: list[Document] = []
+        tasks = []
         for id in ids:
             args: dict[str, Any] = {"row_id": id}
             if filter:
                 args["metadata"] = filter
-            row = await self.vector_store.table.aget(**args)
-            if row is not None:
-                docs.append(self._row_to_doc(row))
-        return docs
+            tasks.append(self.vector_store.table.aget(**args))
+
+        # Fetch the rows concurrently, rather than waiting for each in turn.
+        rows = await asyncio.gather(*tasks)
+        return [self._row_to_doc(row) for row in rows if row is not None]
 
     def _row_to_doc(self, row: Any) -> Document:
         return Document(
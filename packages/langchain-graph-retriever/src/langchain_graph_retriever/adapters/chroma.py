@@ -1,5 +1,6 @@
 """Provides an adapter for Chroma vector store integration."""
 
+import functools
 from collections.abc import Sequence
 from typing import Any
 
@@ -16,6 +17,22 @@ except (ImportError, ModuleNotFoundError):
     raise ImportError(msg)
 
 
+@functools.cache
+def _search_include() -> list[Any]:
+    """Return the fields included in search results, built once."""
+    try:
+        from chromadb.api.types import IncludeEnum
+    except (ImportError, ModuleNotFoundError):
+        msg = "please `pip install chromadb`"
+        raise ImportError(msg)
+
+    return [
+        IncludeEnum.documents,
+        IncludeEnum.metadatas,
+        IncludeEnum.embeddings,
+    ]
+
+
 class ChromaAdapter(ShreddedLangchainAdapter[Chroma]):
     """
     Adapter for [Chroma](https://www.trychroma.com/) vector store.
@@ -51,14 +68,8 @@ class ChromaAdapter(ShreddedLangchainAdapter[Chroma]):
         filter: dict[str, str] | None = None,
         **kwargs: Any,
     ) -> list[Document]:
-        try:
-            from chromadb.api.types import IncludeEnum
-        except (ImportError, ModuleNotFoundError):
-            msg = "please `pip install chromadb`"
-            raise ImportError(msg)
-
-        if k > self.vector_store._collection.count():
-            k = self.vector_store._collection.count()
+        # Clamp `k` to the size of the collection, counting it only once.
+        k = min(k, self.vector_store._collection.count())
         if k == 0:
             return []
 
@@ -66,57 +77,49 @@ class ChromaAdapter(ShreddedLangchainAdapter[Chroma]):
             query_embeddings=embedding,  # type: ignore
             n_results=k,
             where=filter,  # type: ignore
-            include=[
-                IncludeEnum.documents,
-                IncludeEnum.metadatas,
-                IncludeEnum.embeddings,
-            ],
+            include=_search_include(),
             **kwargs,
         )
 
-        docs: list[Document] = []
-        # type-hint: (str, Dict[str, Any], str, ndarray)
-        for content, metadata, id, emb in zip(
+        return self._to_documents(
             results["documents"][0],  # type: ignore
             results["metadatas"][0],  # type: ignore
             results["ids"][0],  # type: ignore
             results["embeddings"][0],  # type: ignore
-        ):
-            docs.append(
-                Document(
-                    id=id,
-                    page_content=content,
-                    metadata={
-                        METADATA_EMBEDDING_KEY: emb.tolist(),
-                        **metadata,
-                    },
-                )
-            )
-        return docs
+        )
 
     @override
     def _get(
         self, ids: Sequence[str], filter: dict[str, Any] | None = None, **kwargs: Any
     ) -> list[Document]:
+        # `ids` is usually already a list (with duplicates removed), so only
+        # copy it if necessary.
         results = self.vector_store.get(
-            ids=list(ids),
+            ids=ids if isinstance(ids, list) else list(ids),
             include=["embeddings", "metadatas", "documents"],
             where=self.update_filter_hook(filter),
             **kwargs,
         )
-        docs = [
-            Document(
-                id=id,
-                page_content=content,
-                metadata={METADATA_EMBEDDING_KEY: emb.tolist(), **metadata},
-            )
-            for (content, metadata, id, emb) in zip(
-                results["documents"],
-                results["metadatas"],
-                results["ids"],
-                results["embeddings"],
-            )
-            # type-hint: (str, Dict[str, Any], str, ndarray)
-        ]
+        return self._to_documents(
+            results["documents"],  # type: ignore
+            results["metadatas"],  # type: ignore
+            results["ids"],
+            results["embeddings"],  # type: ignore
+        )
 
+    def _to_documents(
+        self,
+        contents: list[str],
+        metadatas: list[dict[str, Any] | None],
+        ids: list[str],
+        embeddings: list[Any],
+    ) -> list[Document]:
+        docs: list[Document] = []
+        # type-hint: (str, Dict[str, Any], str, ndarray)
+        for content, metadata, id, emb in zip(contents, metadatas, ids, embeddings):
+            # The metadata returned by Chroma isn't shared, so add the
+            # embedding to it directly rather than copying it.
+            metadata = metadata or {}
+            metadata[METADATA_EMBEDDING_KEY] = emb.tolist()
+            docs.append(Document(id=id, page_content=content, metadata=metadata))
         return docs
@@ -1,6 +1,8 @@
 """Infers the appropriate adapter for a given vector store."""
 
+import functools
 import importlib
+from collections.abc import Callable
 
 from graph_retriever.adapters import Adapter
 from langchain_core.vectorstores.base import VectorStore
@@ -66,6 +68,14 @@ def _infer_adapter_name(cls: type) -> tuple[str, str]:
     )
 
 
+@functools.cache
+def _infer_adapter_class(cls: type) -> Callable[[VectorStore], Adapter]:
+    """Return the adapter class for the store class, caching the result."""
+    module_name, class_name = _infer_adapter_name(cls)
+    adapter_module = importlib.import_module(module_name)
+    return getattr(adapter_module, class_name)
+
+
 def infer_adapter(store: Adapter | VectorStore) -> Adapter:
     """
     Dynamically infer the adapter for a given vector store.
@@ -86,7 +96,5 @@ def infer_adapter(store: Adapter | VectorStore) -> Adapter:
     if isinstance(store, Adapter):
         return store
 
-    module_name, class_name = _infer_adapter_name(store.__class__)
-    adapter_module = importlib.import_module(module_name)
-    adapter_class = getattr(adapter_module, class_name)
+    adapter_class = _infer_adapter_class(store.__class__)
     return adapter_class(store)
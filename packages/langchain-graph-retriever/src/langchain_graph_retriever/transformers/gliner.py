@@ -1,11 +1,22 @@
+import sys
 from collections.abc import Sequence
-from typing import Any
+from functools import cached_property, lru_cache
+from typing import Any, Literal
 
 from gliner import GLiNER  # type: ignore
 from langchain_core.documents import BaseDocumentTransformer, Document
 from typing_extensions import override
 
 
+@lru_cache(maxsize=8)
+def _load_model(model: str, onnx_model_file: str | None) -> GLiNER:
+    if onnx_model_file is not None:
+        return GLiNER.from_pretrained(
+            model, load_onnx_model=True, onnx_model_file=onnx_model_file
+        )
+    return GLiNER.from_pretrained(model)
+
+
 class GLiNERTransformer(BaseDocumentTransformer):
     """
     Add metadata to documents about named entities using **GLiNER**.
@@ -37,14 +48,26 @@ class GLiNERTransformer(BaseDocumentTransformer):
     labels :
         List of entity kinds to extract.
     batch_size :
-        The number of documents to process in each batch.
+        The number of documents to process in each batch. Documents with the
+        same content are only processed once.
     metadata_key_prefix :
         A prefix to add to metadata keys outputted by the extractor.
         This will be prepended to the label, with the value (or values) holding the
         generated keywords for that entity kind.
     model :
         The GLiNER model to use. Pass the name of a model to load or
-        pass an instantiated GLiNER model instance.
+        pass an instantiated GLiNER model instance. Models passed by name are
+        loaded when first used, and shared with other transformers using the
+        same model and backend.
+    backend :
+        The backend used when loading a model by name. `"torch"` loads the
+        PyTorch weights. `"onnx"` loads an exported ONNX model and runs it with
+        ONNX Runtime, which is generally faster for CPU inference. Ignored if an
+        instantiated model is passed.
+    onnx_model_file :
+        The name of the ONNX file within the model repository, used with the
+        `"onnx"` backend. Point this at a quantized export (such as
+        `"model_quantized.onnx"`) to run with int8 weights.
 
     """  # noqa: E501
 
@@ -55,42 +78,76 @@ class GLiNERTransformer(BaseDocumentTransformer):
         batch_size: int = 8,
         metadata_key_prefix: str = "",
         model: str | GLiNER = "urchade/gliner_mediumv2.1",
+        backend: Literal["torch", "onnx"] = "torch",
+        onnx_model_file: str = "model.onnx",
     ):
-        if isinstance(model, GLiNER):
-            self._model = model
-        elif isinstance(model, str):
-            self._model = GLiNER.from_pretrained(model)
-        else:
+        if backend not in ("torch", "onnx"):
+            raise ValueError(f"Invalid backend: {backend}")
+
+        if not isinstance(model, GLiNER | str):
             raise ValueError(f"Invalid model: {model}")
 
+        self._model_or_name = model
+        self._backend = backend
+        self._onnx_model_file = onnx_model_file
         self._batch_size = batch_size
         self._labels = labels
         self.metadata_key_prefix = metadata_key_prefix
 
+    @cached_property
+    def _model(self) -> GLiNER:
+        if isinstance(self._model_or_name, GLiNER):
+            return self._model_or_name
+        # Only pass the ONNX file when it is used, so torch transformers share
+        # a model regardless of it.
+        onnx_model_file = self._onnx_model_file if self._backend == "onnx" else None
+        return _load_model(self._model_or_name, onnx_model_file)
+
     @override
     def transform_documents(
         self, documents: Sequence[Document], **kwargs: Any
     ) -> Sequence[Document]:
-        results: list[Document] = []
-        for i in range(0, len(documents), self._batch_size):
-            batch = documents[i : i + self._batch_size]
-            texts = [item.page_content for item in batch]
+        # Metadata keys for each label, built once per call rather than for
+        # each entity.
+        label_keys = {
+            label: sys.intern(self.metadata_key_prefix + label)
+            for label in self._labels
+        }
+
+        # Extract entities once for each distinct text.
+        texts = list(dict.fromkeys(d.page_content for d in documents))
+        entities_by_text: dict[str, dict[str, dict[str, None]]] = {}
+        for i in range(0, len(texts), self._batch_size):
+            batch = texts[i : i + self._batch_size]
+            # One model call per batch of texts.
             extracted = self._model.batch_predict_entities(
-                texts=texts, labels=self._labels, **kwargs
+                texts=batch, labels=self._labels, **kwargs
             )
-            for j, entities in enumerate(extracted):
-                new_metadata: dict[str, Any] = {}
+            for text, entities in zip(batch, extracted):
+                # Use dicts (rather than sets) to de-duplicate entities while
+                # preserving the order they were found in.
+                new_metadata: dict[str, dict[str, None]] = {}
+                # Entity text is interned, since the same entities tend to
+                # recur across documents.
                 for entity in entities:
-                    label = self.metadata_key_prefix + entity["label"]
-                    new_metadata.setdefault(label, set()).add(entity["text"].lower())
+                    key = label_keys.get(entity["label"])
+                    if key is None:
+                        key = self.metadata_key_prefix + entity["label"]
+                    entity_text = sys.intern(entity["text"].lower())
+                    new_metadata.setdefault(key, {})[entity_text] = None
+                entities_by_text[text] = new_metadata
 
-                result = Document(
-                    id=batch[j].id,
-                    page_content=batch[j].page_content,
-                    metadata=batch[j].metadata.copy(),
+        results: list[Document] = []
+        for document in documents:
+            metadata = document.metadata.copy()
+            for key, values in entities_by_text[document.page_content].items():
+                metadata[key] = list(values)
+
+            results.append(
+                Document(
+                    id=document.id,
+                    page_content=document.page_content,
+                    metadata=metadata,
                 )
-                for key in new_metadata.keys():
-                    result.metadata[key] = list(new_metadata[key])
-
-                results.append(result)
+            )
         return results
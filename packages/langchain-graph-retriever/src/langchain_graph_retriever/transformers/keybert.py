@@ -1,10 +1,24 @@
 from collections.abc import Sequence
-from typing import Any
+from functools import cached_property, lru_cache
+from operator import itemgetter
+from typing import Any, Literal
 
 from keybert import KeyBERT  # type: ignore
 from langchain_core.documents import BaseDocumentTransformer, Document
 from typing_extensions import override
 
+_keyword = itemgetter(0)
+
+
+@lru_cache(maxsize=8)
+def _load_model(model: str, backend: str) -> KeyBERT:
+    if backend == "torch":
+        return KeyBERT(model=model)
+
+    from sentence_transformers import SentenceTransformer  # type: ignore
+
+    return KeyBERT(model=SentenceTransformer(model, backend=backend))
+
 
 class KeyBERTTransformer(BaseDocumentTransformer):
     """
@@ -33,31 +47,51 @@ class KeyBERTTransformer(BaseDocumentTransformer):
 
     Parameters
     ----------
-    batch_size
-        The number of documents to process in each batch.
+    batch_size :
+        The maximum number of documents to pass to KeyBERT in each call. If
+        `None`, all documents are passed in a single call, leaving batching to
+        the underlying encoder and embedding each candidate keyword only once.
+        Documents are batched in order of length to reduce padding, and
+        documents with the same content are only processed once.
     metadata_key :
         The name of the key used in the metadata output.
     model :
         The KeyBERT model to use. Pass the name of a model to load
-        or pass an instantiated KeyBERT model instance.
+        or pass an instantiated KeyBERT model instance. Models passed by name
+        are loaded when first used, and shared with other transformers using
+        the same model and backend.
+    backend :
+        The backend used by the sentence-transformers encoder when loading a
+        model by name. `"torch"` loads the PyTorch weights, while `"onnx"` and
+        `"openvino"` export or load an optimized model, which is generally
+        faster for CPU inference. These also require `optimum[onnxruntime]` or
+        `optimum[openvino]` respectively, which the `keybert` extra doesn't
+        install. Ignored if an instantiated model is passed.
     """
 
     def __init__(
         self,
         *,
-        batch_size: int = 8,
+        batch_size: int | None = None,
         metadata_key: str = "keywords",
         model: str | KeyBERT = "all-MiniLM-L6-v2",
+        backend: Literal["torch", "onnx", "openvino"] = "torch",
     ):
-        if isinstance(model, KeyBERT):
-            self._kw_model = model
-        elif isinstance(model, str):
-            self._kw_model = KeyBERT(model=model)
-        else:
+        if backend not in ("torch", "onnx", "openvino"):
+            raise ValueError(f"Invalid backend: {backend}")
+        if not isinstance(model, KeyBERT | str):
             raise ValueError(f"Invalid model: {model}")
+        self._model_or_name = model
+        self._backend = backend
         self._batch_size = batch_size
         self._metadata_key = metadata_key
 
+    @cached_property
+    def _kw_model(self) -> KeyBERT:
+        if isinstance(self._model_or_name, KeyBERT):
+            return self._model_or_name
+        return _load_model(self._model_or_name, self._backend)
+
     def _extract_keywords(
         self, docs: list[str], **kwargs
     ) -> list[list[tuple[str, float]]]:
@@ -73,20 +107,25 @@ class KeyBERTTransformer(BaseDocumentTransformer):
     def transform_documents(
         self, documents: Sequence[Document], **kwargs: Any
     ) -> Sequence[Document]:
-        results: list[Document] = []
-        for i in range(0, len(documents), self._batch_size):
-            batch = documents[i : i + self._batch_size]
-            texts = [item.page_content for item in batch]
-            extracted = self._extract_keywords(docs=texts, **kwargs)
-            for j, keywords in enumerate(extracted):
-                results.append(
-                    Document(
-                        id=batch[j].id,
-                        page_content=batch[j].page_content,
-                        metadata={
-                            self._metadata_key: [kw[0] for kw in keywords],
-                            **batch[j].metadata,
-                        },
-                    )
-                )
-        return results
+        # Extract keywords once for each distinct text. The texts are batched
+        # in order of length, so each batch is padded to a similar length.
+        texts = sorted(dict.fromkeys(d.page_content for d in documents), key=len)
+        batch_size = self._batch_size or max(len(texts), 1)
+        keywords_by_text: dict[str, list[str]] = {}
+        for i in range(0, len(texts), batch_size):
+            batch = texts[i : i + batch_size]
+            extracted = self._extract_keywords(docs=batch, **kwargs)
+            for text, keywords in zip(batch, extracted):
+                keywords_by_text[text] = list(map(_keyword, keywords))
+
+        return [
+            Document(
+                id=document.id,
+                page_content=document.page_content,
+                metadata={
+                    self._metadata_key: list(keywords_by_text[document.page_content]),
+                    **document.metadata,
+                },
+            )
+            for document in documents
+        ]
@@ -73,7 +73,6 @@ class TestCassandraAdapter(AdapterComplianceSuite):
         )
 
         shredder = ShreddingTransformer()
-        session = cluster.connect()
         session.execute(f"DROP TABLE IF EXISTS {KEYSPACE}.animals")
         store = Cassandra(
             embedding=animal_embeddings,
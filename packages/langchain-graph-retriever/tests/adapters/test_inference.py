@@ -16,7 +16,9 @@ from langchain_core.vectorstores.in_memory import InMemoryVectorStore, VectorSto
 from langchain_graph_retriever.adapters.astra import AstraAdapter
 from langchain_graph_retriever.adapters.cassandra import CassandraAdapter
 from langchain_graph_retriever.adapters.chroma import ChromaAdapter
+from langchain_graph_retriever.adapters.in_memory import InMemoryAdapter
 from langchain_graph_retriever.adapters.inference import (
+    _infer_adapter_class,
     _infer_adapter_name,
     infer_adapter,
 )
@@ -30,6 +32,16 @@ def test_infer_in_memory():
     assert isinstance(adapter, Adapter)
 
 
+def test_infer_adapter_class_cached():
+    class SubclassedStore(InMemoryVectorStore):
+        pass
+
+    assert _infer_adapter_class(SubclassedStore) is InMemoryAdapter
+    hits = _infer_adapter_class.cache_info().hits
+    assert _infer_adapter_class(SubclassedStore) is InMemoryAdapter
+    assert _infer_adapter_class.cache_info().hits == hits + 1
+
+
 @pytest.mark.parametrize(
     "cls,adapter_cls",
     [
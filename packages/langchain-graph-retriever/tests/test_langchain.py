@@ -1,3 +1,5 @@
+import functools
+
 from graph_retriever.testing.embeddings import AnimalEmbeddings
 from langchain_core.vectorstores.in_memory import InMemoryVectorStore
 from langchain_graph_retriever import GraphRetriever
@@ -7,6 +9,16 @@ from tests.conftest import load_animal_docs
 from tests.embeddings import BaseEmbeddings
 
 
+@functools.cache
+def animal_store() -> InMemoryVectorStore:
+    # The retriever tests don't modify the store, so it is built (and the
+    # documents embedded) once rather than for every test.
+    embedding = BaseEmbeddings(AnimalEmbeddings())
+    store = InMemoryVectorStore(embedding=embedding)
+    store.add_documents(load_animal_docs())
+    return store
+
+
 class TestGraphTraversalRetriever(RetrieversIntegrationTests):
     @property
     def retriever_constructor(self) -> type[GraphRetriever]:
@@ -14,11 +26,8 @@ class TestGraphTraversalRetriever(RetrieversIntegrationTests):
 
     @property
     def retriever_constructor_params(self) -> dict:
-        embedding = BaseEmbeddings(AnimalEmbeddings())
-        store = InMemoryVectorStore(embedding=embedding)
-        store.add_documents(load_animal_docs())
         return {
-            "store": store,
+            "store": animal_store(),
             "edges": [("habitat", "habitat")],
         }
 
@@ -27,9 +27,147 @@ def test_transform_documents(animal_docs: list[Document]):
 
     transformed_docs = transformer.transform_documents(animal_docs)
     assert "prefix_first" in transformed_docs[0].metadata
+    assert transformed_docs[0].metadata["prefix_first"] == [
+        animal_docs[0].page_content.split()[0].lower()
+    ]
+
+    # The prefix is read when transforming, so it may be changed.
+    transformer.metadata_key_prefix = "other_"
+    transformed_docs = transformer.transform_documents(animal_docs[:1])
+    assert "other_first" in transformed_docs[0].metadata
 
     with pytest.raises(ValueError, match="Invalid model"):
         GLiNERTransformer([], model={})
 
+    with pytest.raises(ValueError, match="Invalid backend"):
+        GLiNERTransformer([], model=fake_model, backend="openvino")  # type: ignore
+
     # confirm original docs aren't modified
     assert first_doc == animal_docs[0]
+
+
+@pytest.mark.extra
+def test_loads_model_lazily(monkeypatch: pytest.MonkeyPatch):
+    from gliner import GLiNER  # type: ignore
+    from langchain_graph_retriever.transformers.gliner import (
+        GLiNERTransformer,
+        _load_model,
+    )
+
+    loaded: list[str] = []
+
+    class FakeGLiNER(GLiNER):
+        def __init__(self):
+            pass
+
+        def batch_predict_entities(
+            self, texts: list[str], **kwargs: Any
+        ) -> list[list[dict[str, str]]]:
+            return [[] for _ in texts]
+
+    def from_pretrained(model: str, **kwargs: Any) -> GLiNER:
+        loaded.append(model)
+        return FakeGLiNER()
+
+    monkeypatch.setattr(GLiNER, "from_pretrained", from_pretrained)
+    _load_model.cache_clear()
+
+    transformer = GLiNERTransformer(["first"], model="some/model")
+    assert loaded == []
+
+    transformer.transform_documents([Document(page_content="a b c")])
+    transformer.transform_documents([Document(page_content="d e f")])
+    assert loaded == ["some/model"]
+
+    # Other transformers share the loaded model.
+    other = GLiNERTransformer(["second"], model="some/model")
+    other.transform_documents([Document(page_content="a b c")])
+    assert loaded == ["some/model"]
+
+    _load_model.cache_clear()
+
+
+@pytest.mark.extra
+def test_shares_models_by_backend(monkeypatch: pytest.MonkeyPatch):
+    from gliner import GLiNER  # type: ignore
+    from langchain_graph_retriever.transformers.gliner import (
+        GLiNERTransformer,
+        _load_model,
+    )
+
+    loaded: list[tuple[str, dict[str, Any]]] = []
+
+    class FakeGLiNER(GLiNER):
+        def __init__(self):
+            pass
+
+        def batch_predict_entities(
+            self, texts: list[str], **kwargs: Any
+        ) -> list[list[dict[str, str]]]:
+            return [[] for _ in texts]
+
+    def from_pretrained(model: str, **kwargs: Any) -> GLiNER:
+        loaded.append((model, kwargs))
+        return FakeGLiNER()
+
+    monkeypatch.setattr(GLiNER, "from_pretrained", from_pretrained)
+    _load_model.cache_clear()
+
+    docs = [Document(page_content="a b c")]
+
+    # The ONNX file is ignored by the torch backend.
+    GLiNERTransformer(["first"], model="some/model").transform_documents(docs)
+    GLiNERTransformer(
+        ["first"], model="some/model", onnx_model_file="model_quantized.onnx"
+    ).transform_documents(docs)
+    assert loaded == [("some/model", {})]
+
+    GLiNERTransformer(
+        ["first"],
+        model="some/model",
+        backend="onnx",
+        onnx_model_file="model_quantized.onnx",
+    ).transform_documents(docs)
+    assert loaded[1:] == [
+        (
+            "some/model",
+            {"load_onnx_model": True, "onnx_model_file": "model_quantized.onnx"},
+        )
+    ]
+
+    _load_model.cache_clear()
+
+
+@pytest.mark.extra
+def test_duplicate_content_extracted_once():
+    from gliner import GLiNER  # type: ignore
+    from langchain_graph_retriever.transformers.gliner import GLiNERTransformer
+
+    predicted: list[str] = []
+
+    class FakeGLiNER(GLiNER):
+        def __init__(self):
+            pass
+
+        def batch_predict_entities(
+            self, texts: list[str], **kwargs: Any
+        ) -> list[list[dict[str, str]]]:
+            predicted.extend(texts)
+            return [[{"text": text.split()[0], "label": "first"}] for text in texts]
+
+    transformer = GLiNERTransformer(["first"], model=FakeGLiNER(), batch_size=2)
+    transformed_docs = transformer.transform_documents(
+        [
+            Document(id="a", page_content="same text"),
+            Document(id="b", page_content="other text"),
+            Document(id="c", page_content="same text"),
+        ]
+    )
+
+    assert predicted == ["same text", "other text"]
+    assert [d.id for d in transformed_docs] == ["a", "b", "c"]
+    assert [d.metadata["first"] for d in transformed_docs] == [
+        ["same"],
+        ["other"],
+        ["same"],
+    ]
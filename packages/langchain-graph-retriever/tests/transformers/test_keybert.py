@@ -1,4 +1,4 @@
-from typing import Any
+from typing import Any, Literal
 
 import pytest
 from langchain_core.documents import Document
@@ -29,8 +29,118 @@ def test_transform_documents(animal_docs: list[Document]):
     transformed_docs = transformer.transform_documents(animal_docs)
     assert "keybert" in transformed_docs[0].metadata
 
+    # Documents are batched by length, but returned in the original order.
+    assert [d.id for d in transformed_docs] == [d.id for d in animal_docs]
+    for doc, transformed in zip(animal_docs, transformed_docs):
+        assert set(transformed.metadata["keybert"]) == {
+            word for word in doc.page_content.split() if len(word) > 5
+        }
+
     with pytest.raises(ValueError, match="Invalid model"):
         KeyBERTTransformer(model={})
 
+    with pytest.raises(ValueError, match="Invalid backend"):
+        KeyBERTTransformer(model=fake_model, backend="tensorrt")  # type: ignore
+
     # confirm original docs aren't modified
     assert first_doc == animal_docs[0]
+
+
+@pytest.mark.extra
+def test_batch_size(animal_docs: list[Document]):
+    from keybert import KeyBERT  # type: ignore
+    from langchain_graph_retriever.transformers.keybert import KeyBERTTransformer
+
+    class FakeKeyBERT(KeyBERT):
+        def __init__(self):
+            self.calls: list[int] = []
+
+        def extract_keywords(
+            self, docs: list[str], **kwargs: Any
+        ) -> list[list[tuple[str, float]]]:
+            self.calls.append(len(docs))
+            return [[(doc.split()[0], 1.0)] for doc in docs]
+
+    # By default, all documents are passed in a single call.
+    fake_model = FakeKeyBERT()
+    KeyBERTTransformer(model=fake_model).transform_documents(animal_docs)
+    assert fake_model.calls == [len(animal_docs)]
+
+    fake_model = FakeKeyBERT()
+    KeyBERTTransformer(model=fake_model, batch_size=8).transform_documents(animal_docs)
+    assert len(fake_model.calls) == -(-len(animal_docs) // 8)
+    assert max(fake_model.calls) == 8
+
+
+@pytest.mark.extra
+def test_loads_model_lazily(monkeypatch: pytest.MonkeyPatch):
+    from keybert import KeyBERT  # type: ignore
+    from langchain_graph_retriever.transformers import keybert as keybert_module
+
+    loaded: list[str] = []
+
+    class FakeKeyBERT(KeyBERT):
+        def __init__(self, model: str):
+            loaded.append(model)
+
+        def extract_keywords(
+            self, docs: list[str], **kwargs: Any
+        ) -> list[list[tuple[str, float]]]:
+            return [[] for _ in docs]
+
+    monkeypatch.setattr(keybert_module, "KeyBERT", FakeKeyBERT)
+    keybert_module._load_model.cache_clear()
+
+    docs = [Document(page_content="a b c"), Document(page_content="d e f")]
+    transformer = keybert_module.KeyBERTTransformer(model="some/model")
+    assert loaded == []
+
+    transformer.transform_documents(docs)
+    transformer.transform_documents(docs)
+    assert loaded == ["some/model"]
+
+    # Other transformers share the loaded model.
+    other = keybert_module.KeyBERTTransformer(model="some/model", metadata_key="kw")
+    other.transform_documents(docs)
+    assert loaded == ["some/model"]
+
+    keybert_module._load_model.cache_clear()
+
+
+@pytest.mark.extra
+@pytest.mark.parametrize("backend", ["onnx", "openvino"])
+def test_loads_backend_model(
+    monkeypatch: pytest.MonkeyPatch, backend: Literal["onnx", "openvino"]
+):
+    import sentence_transformers  # type: ignore
+    from keybert import KeyBERT  # type: ignore
+    from langchain_graph_retriever.transformers import keybert as keybert_module
+
+    loaded: list[tuple[str, str]] = []
+
+    class FakeSentenceTransformer:
+        def __init__(self, model: str, *, backend: str):
+            loaded.append((model, backend))
+
+    class FakeKeyBERT(KeyBERT):
+        def __init__(self, model: Any):
+            assert isinstance(model, FakeSentenceTransformer)
+
+        def extract_keywords(
+            self, docs: list[str], **kwargs: Any
+        ) -> list[list[tuple[str, float]]]:
+            return [[] for _ in docs]
+
+    monkeypatch.setattr(
+        sentence_transformers, "SentenceTransformer", FakeSentenceTransformer
+    )
+    monkeypatch.setattr(keybert_module, "KeyBERT", FakeKeyBERT)
+    keybert_module._load_model.cache_clear()
+
+    transformer = keybert_module.KeyBERTTransformer(model="some/model", backend=backend)
+    transformer.transform_documents(
+        [Document(page_content="a b c"), Document(page_content="d e f")]
+    )
+    assert loaded == [("some/model", backend)]
+
+    keybert_module._load_model.cache_clear()
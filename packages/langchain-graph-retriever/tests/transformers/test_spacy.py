@@ -11,12 +11,11 @@ def test_transform_documents(animal_docs: list[Document]):
 
     class FakeLanguage(Language):
         def __init__(self):
-            pass
+            self.vocab = Vocab()
 
         def __call__(self, text: str | Doc, **kwargs) -> Doc:
-            vocab = Vocab()
             assert isinstance(text, str)
-            doc = Doc(vocab=vocab, words=text.split())
+            doc = Doc(vocab=self.vocab, words=text.split())
             doc.ents = [
                 Span(doc, start=0, end=1, label="first"),
                 Span(doc, start=1, end=2, label="second"),